@@ -1,8 +1,42 @@
 """Convert book content to typing game format"""
 
-import re
 from pathlib import Path
 
+from typing_game.utils import count_lines
+
+class _NonAlphaToSpace(dict):
+    """str.translate table mapping every non-letter code point to a space.
+
+    Filled lazily, so curly quotes, dashes and other non-Latin-1
+    punctuation found in real books are stripped too; each code point is
+    classified once.
+    """
+
+    def __missing__(self, cp: int) -> str:
+        ch = chr(cp)
+        out = self[cp] = ch if ch.isalpha() else ' '
+        return out
+
+
+_NONALPHA = _NonAlphaToSpace()
+
+# Easy words (short, common)
+_EASY_WORDS = (
+    "the", "and", "for", "you", "all", "not", "can", "had", "but", "was",
+    "one", "our", "out", "day", "get", "has", "him", "his", "how", "man",
+    "new", "now", "old", "see", "two", "way", "who", "boy", "did", "its",
+    "let", "put", "say", "she", "too", "use"
+)
+
+# Medium words (longer, moderate difficulty)
+_MEDIUM_WORDS = (
+    "about", "after", "again", "before", "being", "below", "between",
+    "could", "every", "first", "found", "great", "group", "large",
+    "light", "might", "never", "other", "place", "right", "small",
+    "sound", "still", "such", "think", "three", "through", "under",
+    "water", "where", "which", "while", "world", "would", "write", "years"
+)
+
 def convert_book_to_words(input_file: Path, output_file: Path, preserve_punctuation: bool = True):
     """Convert a book/text file to word-per-line format for typing game.
     
@@ -11,25 +45,33 @@ def convert_book_to_words(input_file: Path, output_file: Path, preserve_punctuat
         output_file: Path where to save word-per-line output
         preserve_punctuation: Keep punctuation attached to words
     """
+    # Write next to the target and swap it in only on success, so a decode
+    # error mid-book can't leave a truncated list over a good one
+    tmp = output_file.with_suffix(output_file.suffix + '.tmp')
     try:
-        content = input_file.read_text(encoding='utf-8')
-        
         if preserve_punctuation:
             # Split on whitespace but keep punctuation attached
-            words = re.findall(r'\S+', content)
+            tokenize = str.split
         else:
             # Remove punctuation and split
-            words = re.findall(r'\b[a-zA-Z]+\b', content.lower())
+            def tokenize(line):
+                return line.lower().translate(_NONALPHA).split()
         
-        # Write one word per line
-        with open(output_file, 'w', encoding='utf-8') as f:
-            for word in words:
-                f.write(word + '\n')
+        # Stream line by line so peak memory does not grow with book size
+        count = 0
+        with input_file.open('r', encoding='utf-8') as fin, \
+                open(tmp, 'w', encoding='utf-8', buffering=1 << 20) as fout:
+            for line in fin:
+                words = tokenize(line)
+                fout.writelines(word + '\n' for word in words)
+                count += len(words)
+        tmp.replace(output_file)
         
-        print(f"✅ Converted {len(words)} words from {input_file.name} to {output_file.name}")
-        return len(words)
+        print(f"✅ Converted {count} words from {input_file.name} to {output_file.name}")
+        return count
         
     except Exception as e:
+        tmp.unlink(missing_ok=True)
         print(f"❌ Error converting file: {e}")
         return 0
 
@@ -37,26 +79,9 @@ def create_difficulty_levels():
     """Create different difficulty word lists"""
     base_path = Path("data/wordlists")
     
-    # Easy words (short, common)
-    easy_words = [
-        "the", "and", "for", "you", "all", "not", "can", "had", "but", "was",
-        "one", "our", "out", "day", "get", "has", "him", "his", "how", "man",
-        "new", "now", "old", "see", "two", "way", "who", "boy", "did", "its",
-        "let", "put", "say", "she", "too", "use"
-    ]
-    
-    # Medium words (longer, moderate difficulty)
-    medium_words = [
-        "about", "after", "again", "before", "being", "below", "between",
-        "could", "every", "first", "found", "great", "group", "large",
-        "light", "might", "never", "other", "place", "right", "small",
-        "sound", "still", "such", "think", "three", "through", "under",
-        "water", "where", "which", "while", "world", "would", "write", "years"
-    ]
-    
-    # Save word lists
-    (base_path / "easy.txt").write_text('\n'.join(easy_words))
-    (base_path / "medium.txt").write_text('\n'.join(medium_words))
+    # Save word lists (newline-terminated so POSIX tools see complete lines)
+    (base_path / "easy.txt").write_text('\n'.join(_EASY_WORDS) + '\n')
+    (base_path / "medium.txt").write_text('\n'.join(_MEDIUM_WORDS) + '\n')
     
     print("✅ Created easy.txt and medium.txt word lists")
 
@@ -84,5 +109,5 @@ if __name__ == "__main__":
     wordlist_dir = Path("data/wordlists")
     if wordlist_dir.exists():
         for file in wordlist_dir.glob("*.txt"):
-            word_count = len(file.read_text().splitlines())
+            word_count = count_lines(file)
             print(f"   - {file.name}: {word_count} words")
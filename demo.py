@@ -2,6 +2,7 @@
 
 from typing_game.engine import interactive_loop
 from typing_game.config import ModeConfig
+from typing_game.utils import count_lines
 from pathlib import Path
 
 def choose_difficulty():
@@ -46,7 +47,7 @@ def main():
     )
     
     if wordlist:
-        word_count = len(wordlist.read_text().splitlines())
+        word_count = count_lines(wordlist)
         print(f"\n✅ Using {wordlist.name} ({word_count} words available)")
     else:
         print("\n✅ Using default word list")
@@ -1,12 +1,25 @@
 """Enhanced word loading for books and longer passages."""
 
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
-import re
+from typing import List, Optional, Tuple
+
+@lru_cache(maxsize=16)
+def _load_cached(path_str: str, mtime_ns: int) -> Tuple[str, ...]:
+    # mtime_ns is unused in the body; it keys the cache so edited files are re-read
+    return tuple(Path(path_str).read_text(encoding='utf-8').split())
+
+@lru_cache(maxsize=16)
+def _chunks_cached(path_str: str, mtime_ns: int, chunk_size: int) -> Tuple[str, ...]:
+    return tuple(create_sentence_chunks(_load_cached(path_str, mtime_ns), chunk_size))
 
 def load_book_content(file_path: Path) -> List[str]:
     """Load a book/passage and split into words, preserving punctuation and capitalization.
     
+    Results are cached per path and modification time, so repeated sessions
+    on the same book skip re-reading and re-tokenizing the file.
+    
     Args:
         file_path: Path to text file containing book content
         
@@ -14,13 +27,10 @@ def load_book_content(file_path: Path) -> List[str]:
         List of words with proper spacing and punctuation
     """
     try:
-        content = file_path.read_text(encoding='utf-8')
+        # Split on whitespace; punctuation stays attached to words
+        words = _load_cached(str(file_path), file_path.stat().st_mtime_ns)
         
-        # Split into words while preserving punctuation
-        # This regex keeps punctuation attached to words
-        words = re.findall(r'\S+', content)
-        
-        return words
+        return list(words)
     except Exception as e:
         print(f"Error loading book content: {e}")
         return ["error", "loading", "book", "content"]
@@ -35,11 +45,10 @@ def create_sentence_chunks(words: List[str], chunk_size: int = 10) -> List[str]:
     Returns:
         List of word chunks (phrases/sentences)
     """
-    chunks = []
-    for i in range(0, len(words), chunk_size):
-        chunk = ' '.join(words[i:i + chunk_size])
-        chunks.append(chunk)
-    return chunks
+    n_chunks = (len(words) + chunk_size - 1) // chunk_size
+    it = iter(words)
+    # islice pulls from one shared iterator, so no per-chunk slice list is built
+    return [' '.join(islice(it, chunk_size)) for _ in range(n_chunks)]
 
 def format_book_for_typing(file_path: Path, mode: str = "words") -> List[str]:
     """Format book content for different typing modes.
@@ -52,13 +61,17 @@ def format_book_for_typing(file_path: Path, mode: str = "words") -> List[str]:
     Returns:
         List of typing units based on mode
     """
-    words = load_book_content(file_path)
-    
-    if mode == "words":
-        return words
-    elif mode == "sentences":
-        return create_sentence_chunks(words, chunk_size=8)
+    if mode == "sentences":
+        chunk_size = 8
     elif mode == "paragraphs":
-        return create_sentence_chunks(words, chunk_size=25)
+        chunk_size = 25
     else:
-        return words
+        return load_book_content(file_path)
+    
+    try:
+        chunks = _chunks_cached(str(file_path), file_path.stat().st_mtime_ns, chunk_size)
+    except Exception as e:
+        print(f"Error loading book content: {e}")
+        # Chunk the sentinel like real content, as load-then-chunk used to
+        return create_sentence_chunks(["error", "loading", "book", "content"], chunk_size)
+    return list(chunks)
@@ -15,9 +15,15 @@ Persistence is intentionally minimal JSON storing only primitive fields.
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Mapping, Optional
+from typing import Any, Optional
+
+try:  # optional faster JSON backend
+	import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fallback path
+	orjson = None  # type: ignore[assignment]
 
 # Public API re-export list
 
@@ -65,30 +71,38 @@ def validate_mode_config(cfg: ModeConfig) -> None:
 	  * top_n_highscores > 0.
 	"""
 
-	timed_set = cfg.timed_seconds is not None
-	words_set = cfg.word_count is not None
-	if timed_set == words_set:  # both True or both False
-		raise ValueError("Exactly one of timed_seconds or word_count must be specified")
-	if cfg.timed_seconds is not None and cfg.timed_seconds <= 0:
-		raise ValueError("timed_seconds must be > 0")
-	if cfg.word_count is not None and cfg.word_count <= 0:
-		raise ValueError("word_count must be > 0")
-	if not (0.0 <= cfg.punctuation_prob <= 1.0):
-		raise ValueError("punctuation_prob must be between 0 and 1 inclusive")
-	if cfg.top_n_highscores <= 0:
-		raise ValueError("top_n_highscores must be > 0")
+	ts, wc = cfg.timed_seconds, cfg.word_count
+	# Single elif chain: the all-valid case falls through and raises once at most
+	err: str | None = None
+	if (ts is None) == (wc is None):  # both set or both unset
+		err = "Exactly one of timed_seconds or word_count must be specified"
+	elif ts is not None and ts <= 0:
+		err = "timed_seconds must be > 0"
+	elif wc is not None and wc <= 0:
+		err = "word_count must be > 0"
+	elif not (0.0 <= cfg.punctuation_prob <= 1.0):
+		err = "punctuation_prob must be between 0 and 1 inclusive"
+	elif cfg.top_n_highscores <= 0:
+		err = "top_n_highscores must be > 0"
 	# Wordlist existence if provided
-	if cfg.wordlist_path is not None and not cfg.wordlist_path.exists():
-		raise ValueError(f"wordlist path does not exist: {cfg.wordlist_path}")
+	elif cfg.wordlist_path is not None and not cfg.wordlist_path.exists():
+		err = f"wordlist path does not exist: {cfg.wordlist_path}"
+	if err is not None:
+		raise ValueError(err)
 
 
 # ----------------------------- Defaults & Paths -----------------------------
+
+
+@lru_cache(maxsize=None)
 def _project_root() -> Path:
 	# typing_game/config.py -> typing_game -> project root (parent of package dir)
 	return Path(__file__).resolve().parent.parent
 
 
+@lru_cache(maxsize=None)
 def default_wordlist_path() -> Path | None:
+	# Memoized: the bundled list does not move during a run, so stat it once
 	path = _project_root() / "data" / "wordlists" / "english_1k.txt"
 	return path if path.exists() else None
 
@@ -116,18 +130,27 @@ def default_config() -> ModeConfig:
 def get_or_create_config_path(filename: str = "config.json") -> Path:
 	"""Return path to persisted config file, ensuring parent directory exists.
 
-	Uses user home directory ``~/.typing_game``.
+	Uses user home directory ``~/.typing_game``. The directory is created on
+	first use of each base path; later calls skip the mkdir syscall.
 	"""
 	base = Path.home() / ".typing_game"
-	base.mkdir(parents=True, exist_ok=True)
+	_ensure_dir(base)
 	return base / filename
 
 
+@lru_cache(maxsize=8)
+def _ensure_dir(base: Path) -> None:
+	# Keyed by path, so a changed HOME gets its own mkdir
+	base.mkdir(parents=True, exist_ok=True)
+
+
 # ------------------------------- Merge Helpers ------------------------------
 def _get_attr(obj: Any, name: str, default: Any = None) -> Any:
-	if isinstance(obj, Mapping):  # dict-like
-		return obj.get(name, default)
-	return getattr(obj, name, default)
+	# argparse.Namespace is the common case; probing for ``keys`` is cheaper
+	# than an isinstance check against the Mapping ABC.
+	if not hasattr(obj, "keys"):
+		return getattr(obj, name, default)
+	return obj.get(name, default)  # dict-like
 
 
 def merge_cli_args(base: Optional[ModeConfig], args: Any) -> ModeConfig:
@@ -154,10 +177,17 @@ def merge_cli_args(base: Optional[ModeConfig], args: Any) -> ModeConfig:
 
 	if timed is not None and words is not None:
 		raise ValueError("Specify only one of --timed or --words")
+	# Providing one mode clears the other; neither keeps the base mode
+	if timed is not None:
+		timed_seconds, word_count = timed, None
+	elif words is not None:
+		timed_seconds, word_count = None, words
+	else:
+		timed_seconds, word_count = base.timed_seconds, base.word_count
 
 	new = ModeConfig(
-		timed_seconds=(timed if timed is not None else (None if words is not None else base.timed_seconds)),
-		word_count=(words if words is not None else (None if timed is not None else base.word_count)),
+		timed_seconds=timed_seconds,
+		word_count=word_count,
 		punctuation_prob=(punct if punct is not None else base.punctuation_prob),
 		numbers=(numbers_flag if numbers_flag is not None else base.numbers),
 		wordlist_path=(Path(wordlist) if wordlist is not None else base.wordlist_path),
@@ -170,18 +200,37 @@ def merge_cli_args(base: Optional[ModeConfig], args: Any) -> ModeConfig:
 
 # ------------------------------- Persistence --------------------------------
 def _config_to_json(cfg: ModeConfig) -> dict[str, Any]:
-	data = asdict(cfg)
-	if cfg.wordlist_path is not None:
-		data["wordlist_path"] = str(cfg.wordlist_path)
-	return data
+	# Flat literal instead of dataclasses.asdict (which deep-copies every field)
+	return {
+		"timed_seconds": cfg.timed_seconds,
+		"word_count": cfg.word_count,
+		"punctuation_prob": cfg.punctuation_prob,
+		"numbers": cfg.numbers,
+		"wordlist_path": str(cfg.wordlist_path) if cfg.wordlist_path is not None else None,
+		"top_n_highscores": cfg.top_n_highscores,
+	}
 
 
 def save_last_config(cfg: ModeConfig, path: Optional[Path] = None) -> None:
-	"""Persist config to JSON. Ignores errors silently (best-effort)."""
+	"""Persist config to JSON. Ignores errors silently (best-effort).
+
+	Uses ``orjson`` when installed; otherwise stdlib ``json`` in compact form
+	(the file is machine-written and machine-read).
+	"""
 	if path is None:
 		path = get_or_create_config_path()
+	data = _config_to_json(cfg)
+	if orjson is not None:
+		payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+	else:
+		payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
 	try:
-		path.write_text(json.dumps(_config_to_json(cfg), indent=2), encoding="utf-8")
+		try:
+			path.write_bytes(payload)
+		except FileNotFoundError:
+			# Directory removed since _ensure_dir memoized it: recreate and retry
+			path.parent.mkdir(parents=True, exist_ok=True)
+			path.write_bytes(payload)
 	except OSError:
 		pass  # best effort
 
@@ -193,20 +242,20 @@ def load_last_config(path: Optional[Path] = None) -> ModeConfig:
 	"""
 	if path is None:
 		path = get_or_create_config_path()
-	if not path.exists():
-		return default_config()
 	try:
-		data = json.loads(path.read_text(encoding="utf-8"))
+		# json.loads accepts bytes directly, skipping a separate decode step
+		data = json.loads(path.read_bytes())
+		wp = data.get("wordlist_path")
 		cfg = ModeConfig(
 			timed_seconds=data.get("timed_seconds"),
 			word_count=data.get("word_count"),
 			punctuation_prob=data.get("punctuation_prob", 0.0),
 			numbers=data.get("numbers", False),
-			wordlist_path=Path(data["wordlist_path"]) if data.get("wordlist_path") else default_wordlist_path(),
+			wordlist_path=Path(wp) if wp else default_wordlist_path(),
 			top_n_highscores=data.get("top_n_highscores", 25),
 		)
 		validate_mode_config(cfg)
 		return cfg
-	except Exception:
+	except Exception:  # incl. no saved state yet; cheaper than a prior exists() stat
 		return default_config()
 
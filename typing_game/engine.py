@@ -18,8 +18,14 @@ keystroke handling & curses integration will replace this in later milestones.
 
 from __future__ import annotations
 
+import math
+import os
+import sys
 import time
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import islice
+from operator import eq
 from typing import Callable, Iterator, Optional
 from pathlib import Path
 
@@ -30,12 +36,14 @@ from .metrics import (
 	compute_raw_wpm,
 	elapsed_seconds,
 	update_on_char,
+	update_on_chars,
 	compute_consistency,
 )
 from .modes import build_timed_mode, build_word_count_mode, mode_key
-from .storage import HighScoreEntry, load_highscores, record_highscore
+from .storage import HighScoreEntry, get_best_wpm, queue_highscore
 from .ui import (
 	CursesSession,
+	UIThrottle,
 	build_header_line,
 	build_progress_bar,
 	highlight_word,
@@ -50,8 +58,10 @@ __all__ = [
 	"run_session",
 ]
 
+_QUIT_CMD = "/quit"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class SessionResult:
 	mode_config: ModeConfig
 	raw_wpm: float
@@ -65,17 +75,21 @@ class SessionResult:
 	previous_best_net_wpm: Optional[float] = None
 	consistency: float = 0.0
 
-def _commit_word(stats: LiveStats, target: str, typed: str):
-	# update per-character stats for entire word + trailing space
-	for i, ch in enumerate(typed):
-		correct = i < len(target) and ch == target[i]
-		update_on_char(stats, correct)
+def _count_matches(target: str, typed: str) -> int:
+	"""Return the number of positions where typed matches target.
+
+	map/eq/sum all run in C, so no bytecode executes per character.
+	"""
+	return sum(map(eq, target, typed))
+
 
-	# Count omissions (characters not typed) as errors
-	if len(typed) < len(target):
-		omissions = len(target) - len(typed)
-		for _ in range(omissions):
-			update_on_char(stats, False)  # Each omitted character is an error
+def _commit_word(stats: LiveStats, target: str, typed: str, now: Optional[float] = None):
+	# Positional matches; extra typed characters beyond target are wrong
+	correct = _count_matches(target, typed)
+	# Omissions (characters not typed) count as errors too
+	omissions = max(0, len(target) - len(typed))
+	# One aggregate update instead of one update_on_char call per character
+	update_on_chars(stats, correct, len(typed) + omissions, now)
 
 	# Play feedback sound based on overall word correctness
 	is_correct = (typed == target)
@@ -91,16 +105,10 @@ def _analyze_word_errors(target: str, typed: str) -> dict[str, int]:
 	
 	Returns dict with keys: 'correct', 'wrong', 'omissions', 'extras'
 	"""
-	correct = 0
-	wrong = 0
-	
 	# Count character-by-character matches/mismatches
 	min_len = min(len(target), len(typed))
-	for i in range(min_len):
-		if target[i] == typed[i]:
-			correct += 1
-		else:
-			wrong += 1
+	correct = _count_matches(target, typed)
+	wrong = min_len - correct
 	
 	# Count omissions and extras
 	omissions = max(0, len(target) - len(typed))
@@ -114,11 +122,98 @@ def _analyze_word_errors(target: str, typed: str) -> dict[str, int]:
 	}
 
 
+def _input_with_timeout(prompt: str, timeout_s: float) -> str | None:  # pragma: no cover - terminal I/O
+	"""Read one line from the terminal, giving up after ``timeout_s`` seconds.
+
+	Returns None on timeout. POSIX waits with ``select``; Windows polls
+	``msvcrt.kbhit`` at 10ms granularity. Neither busy-spins.
+	"""
+	sys.stdout.write(prompt)
+	sys.stdout.flush()
+	if os.name == "nt":
+		import msvcrt  # type: ignore
+
+		chars: list[str] = []
+		end = time.monotonic() + timeout_s
+		while time.monotonic() < end:
+			if not msvcrt.kbhit():
+				time.sleep(0.01)
+				continue
+			ch = msvcrt.getwche()
+			if ch in ("\r", "\n"):
+				sys.stdout.write("\n")
+				return "".join(chars)
+			if ch == "\b":
+				if chars:
+					chars.pop()
+					sys.stdout.write(" \b")
+				continue
+			chars.append(ch)
+		# Drop anything still queued so it can't leak into the next prompt
+		while msvcrt.kbhit():
+			msvcrt.getwch()
+		sys.stdout.write("\n")
+		return None
+	import select
+
+	ready, _, _ = select.select([sys.stdin], [], [], max(0.0, timeout_s))
+	if not ready:
+		# A partly typed line sits in the tty's canonical buffer; discard it so
+		# it isn't read back as the start of the next input()
+		try:
+			import termios
+		except ImportError:
+			termios = None  # type: ignore[assignment]
+		if termios is not None:
+			try:
+				termios.tcflush(sys.stdin, termios.TCIFLUSH)
+			except (OSError, termios.error):
+				pass
+		sys.stdout.write("\n")
+		return None
+	line = sys.stdin.readline()
+	if not line:
+		raise EOFError
+	return line.rstrip("\n")
+
+
+def _refill(targets: list[str], words_iter: Iterator[str], batch: int = 32) -> None:
+	"""Append up to ``batch`` upcoming words in one islice pass."""
+	targets.extend(islice(words_iter, batch))
+
+
 def _iterate_mode_words(mode) -> Iterator[str]:
-	w = mode.words()
-	if isinstance(w, Iterator):
-		return w
-	return iter(w)
+	# iter() returns iterators unchanged, so no ABC isinstance check is needed
+	return iter(mode.words())
+
+
+def _build_mode(cfg: ModeConfig):
+	if cfg.timed_seconds is not None:
+		return build_timed_mode(cfg.timed_seconds, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path, top_n_highscores=cfg.top_n_highscores)
+	assert cfg.word_count is not None
+	return build_word_count_mode(cfg.word_count, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path, top_n_highscores=cfg.top_n_highscores)
+
+
+def _finish_session(cfg: ModeConfig, stats: LiveStats, now: float) -> SessionResult:
+	"""Compute final metrics, record a highscore if improved, build the result."""
+	elapsed = elapsed_seconds(stats, now)
+	raw_wpm = compute_raw_wpm(stats, now)
+	net_wpm = compute_net_wpm(stats, now)
+	acc = stats.accuracy()
+	key = mode_key(cfg)
+	
+	# previous best lookup BEFORE recording new score
+	prev_best = get_best_wpm(key)
+	
+	# Only record highscore if it's an improvement or first attempt
+	highscore_new = False
+	if prev_best is None or net_wpm > prev_best:
+		entry = HighScoreEntry.create(key, net_wpm, acc, raw_wpm, stats.errors, stats.chars_typed)
+		# Deferred write: rapid restarts coalesce into one file rewrite
+		highscore_new = queue_highscore(key, entry, top_n=cfg.top_n_highscores)
+	
+	consistency = compute_consistency(stats)
+	return SessionResult(cfg, raw_wpm, net_wpm, acc, stats.errors, stats.chars_typed, elapsed, highscore_new, previous_best_net_wpm=prev_best, consistency=consistency)
 
 
 def run_session(
@@ -140,134 +235,164 @@ def run_session(
 	validate_mode_config(cfg)
 	if time_func is None:
 		time_func = time.monotonic
+	# Real terminal + timed mode: bound each read by the deadline instead of
+	# blocking until Enter. Injected input_func / piped stdin keep plain input.
+	poll_input = input_func is None and cfg.timed_seconds is not None and sys.stdin.isatty()
 	if input_func is None:
 		input_func = input  # pragma: no cover - real interactive path
 	started = time_func()
 	stats = LiveStats(started_at=started, last_update=started)
 
-	if cfg.timed_seconds is not None:
-		mode = build_timed_mode(cfg.timed_seconds, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path, top_n_highscores=cfg.top_n_highscores)
-	else:
-		assert cfg.word_count is not None
-		mode = build_word_count_mode(cfg.word_count, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path, top_n_highscores=cfg.top_n_highscores)
+	mode = _build_mode(cfg)
 
 	words_iter = _iterate_mode_words(mode)
 	targets: list[str] = []
+	if cfg.word_count is not None:
+		# Finite mode: materialize the exact sequence; no generator in the loop
+		targets = list(islice(words_iter, cfg.word_count))
 	committed = 0
 	word_started_at = started
+	# Mode specialization, resolved once: the unused limit is infinite and the
+	# prompt template only includes the time suffix in timed mode.
+	timed = cfg.timed_seconds is not None
+	if timed:
+		deadline = started + cfg.timed_seconds  # absolute end time
+		word_limit = math.inf
+		build_prompt = "[{0}] {1} ({2:.1f}s left): ".format
+	else:
+		deadline = math.inf
+		word_limit = cfg.word_count
+		build_prompt = "[{0}] {1}: ".format
 
+	# One clock read per word: the reading taken after input stamps the commit,
+	# the word duration and the next iteration's deadline check.
+	now = started
 	while True:
-		now = time_func()
-		if cfg.timed_seconds is not None and elapsed_seconds(stats, now) >= cfg.timed_seconds:
+		if now >= deadline or committed >= word_limit:
 			break
-		if cfg.word_count is not None and committed >= cfg.word_count:
-			break
-		# fetch next target if needed
-		if committed >= len(targets):
-			targets.append(next(words_iter))
+		# Keep a few words buffered; timed mode refills in batches of 32
+		if len(targets) - committed < 4:
+			_refill(targets, words_iter)
 		target = targets[committed]
-		remaining_time = None
-		if cfg.timed_seconds is not None:
-			remaining_time = max(0, cfg.timed_seconds - elapsed_seconds(stats, now))
-		prompt = f"[{committed+1}] {target}"
-		if remaining_time is not None:
-			prompt += f" ({remaining_time:.1f}s left)"
-		typed = input_func(prompt + ": ")
-		if typed.strip() == "/quit":
+		if timed:
+			remaining_time = max(0, deadline - now)
+			prompt = build_prompt(committed + 1, target, remaining_time)
+		else:
+			prompt = build_prompt(committed + 1, target)
+		if poll_input:  # implies timed, so remaining_time is set
+			typed = _input_with_timeout(prompt, remaining_time)
+			if typed is None:  # time ran out while waiting; word not committed
+				break
+		else:
+			typed = input_func(prompt)
+		now = time_func()
+		# Exact match first; strip() only allocates when the sentinel is present
+		if typed == _QUIT_CMD or (_QUIT_CMD in typed and typed.strip() == _QUIT_CMD):
 			break
-		_commit_word(stats, target, typed)
+		_commit_word(stats, target, typed, now)
 		# record duration for this word
-		word_time = time_func() - word_started_at
+		word_time = now - word_started_at
 		if word_time >= 0:
 			stats.word_durations.append(word_time)
-		word_started_at = time_func()
+		word_started_at = now
 		committed += 1
 		# space char after word (simulate):
-		update_on_char(stats, True)  # treat separating space as correct char for wpm baseline
+		update_on_char(stats, True, now)  # treat separating space as correct char for wpm baseline
 
-	elapsed = elapsed_seconds(stats)
-	raw_wpm = compute_raw_wpm(stats)
-	net_wpm = compute_net_wpm(stats)
-	acc = stats.accuracy()
-	key = mode_key(cfg)
-	
-	# previous best lookup BEFORE recording new score
-	prev_best: Optional[float] = None
+	return _finish_session(cfg, stats, time_func())
+
+
+@lru_cache(maxsize=1)
+def _enable_windows_vt() -> bool:  # pragma: no cover - Windows console only
+	"""Enable ANSI escape processing on the Windows console (Windows 10+).
+
+	Returns False on older consoles or when stdout is not a console.
+	"""
 	try:
-		store = load_highscores()
-		if key in store and store[key]:
-			prev_best = max((e.wpm for e in store[key]), default=None)
+		import ctypes
+
+		kernel32 = ctypes.windll.kernel32  # type: ignore[attr-defined]
+		handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+		mode = ctypes.c_uint32()
+		if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+			return False
+		# ENABLE_VIRTUAL_TERMINAL_PROCESSING
+		return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
 	except Exception:
-		pass
-	
-	# Only record highscore if it's an improvement or first attempt
-	highscore_new = False
-	if prev_best is None or net_wpm > prev_best:
-		entry = HighScoreEntry.create(key, net_wpm, acc, raw_wpm, stats.errors, stats.chars_typed)
-		highscore_new = record_highscore(key, entry, top_n=cfg.top_n_highscores)
-	
-	consistency = compute_consistency(stats)
-	return SessionResult(cfg, raw_wpm, net_wpm, acc, stats.errors, stats.chars_typed, elapsed, highscore_new, previous_best_net_wpm=prev_best, consistency=consistency)
+		return False
 
 
 def _clear_screen():  # pragma: no cover - simple utility
-	import os
-	cmd = "cls" if os.name == "nt" else "clear"
-	try:
-		os.system(cmd)
-	except Exception:
-		print("\n" * 3)
+	# ANSI home + clear is a single write; os.system would fork a shell each time
+	if os.name == "nt" and not _enable_windows_vt():
+		try:
+			os.system("cls")  # legacy console without VT support
+		except Exception:
+			print("\n" * 3)
+		return
+	sys.stdout.write("\x1b[H\x1b[2J")
+	sys.stdout.flush()
 
 
 def end_screen(res: SessionResult):  # pragma: no cover - I/O convenience
 	_clear_screen()
-	print("=== Typing Session Summary ===")
+	# Collect all lines and emit them with one write
+	lines = ["=== Typing Session Summary ==="]
 	kind = res.mode_config.mode_kind()
 	if kind == "timed":
 		desc = f"Timed {res.mode_config.timed_seconds}s"
 	else:
 		desc = f"Words {res.mode_config.word_count}"
-	print(f"Mode: {desc}")
-	print(f"Elapsed: {res.elapsed:.1f}s  Raw WPM: {res.raw_wpm:.2f}  Net WPM: {res.net_wpm:.2f}")
-	print(f"Accuracy: {res.accuracy*100:.2f}%  Errors: {res.errors}  Chars: {res.chars}")
+	lines.append(f"Mode: {desc}")
+	lines.append(f"Elapsed: {res.elapsed:.1f}s  Raw WPM: {res.raw_wpm:.2f}  Net WPM: {res.net_wpm:.2f}")
+	lines.append(f"Accuracy: {res.accuracy*100:.2f}%  Errors: {res.errors}  Chars: {res.chars}")
 	if res.consistency > 0:
-		print(f"Consistency: {res.consistency*100:.1f}%")
+		lines.append(f"Consistency: {res.consistency*100:.1f}%")
 	
 	# Show improvement feedback
 	if res.previous_best_net_wpm is not None:
 		improvement = res.net_wpm - res.previous_best_net_wpm
-		print(f"Previous Best Net WPM: {res.previous_best_net_wpm:.2f}")
+		lines.append(f"Previous Best Net WPM: {res.previous_best_net_wpm:.2f}")
 		if improvement > 0:
-			print(f"🎉 IMPROVEMENT: +{improvement:.2f} WPM!")
+			lines.append(f"🎉 IMPROVEMENT: +{improvement:.2f} WPM!")
 		elif improvement < 0:
-			print(f"📉 Below best by {abs(improvement):.2f} WPM")
+			lines.append(f"📉 Below best by {abs(improvement):.2f} WPM")
 		else:
-			print("🎯 Matched your best!")
+			lines.append("🎯 Matched your best!")
 	else:
-		print("🆕 First attempt for this mode!")
+		lines.append("🆕 First attempt for this mode!")
 
 	# Sanity: only show saved banner if it actually beat the previous
 	if res.highscore_new and (res.previous_best_net_wpm is None or res.net_wpm > res.previous_best_net_wpm):
-		print("*** NEW HIGHSCORE SAVED! ***")
+		lines.append("*** NEW HIGHSCORE SAVED! ***")
 	elif res.previous_best_net_wpm is not None and res.net_wpm <= res.previous_best_net_wpm:
-		print("💡 No highscore saved (no improvement)")
-	print("==============================")
+		lines.append("💡 No highscore saved (no improvement)")
+	lines.append("==============================")
+	sys.stdout.write("\n".join(lines) + "\n")
+	sys.stdout.flush()
 
 
 _fallback_banner_printed = False
 
 
+@lru_cache(maxsize=1)
+def _probe_curses() -> bool:
+	"""Return True if curses is importable; probed at most once per process."""
+	try:
+		__import__("curses")  # type: ignore  # imported for availability check only
+	except Exception:
+		return False
+	return True
+
+
 def _maybe_print_fallback_banner():  # pragma: no cover - simple UX hint
 	global _fallback_banner_printed
 	if _fallback_banner_printed:
 		return
-	try:
-		__import__("curses")  # type: ignore  # imported for side-effect check only
-	except Exception:
+	if not _probe_curses():
 		print("[Plain Mode] Running without curses (limited live feedback).")
 		print("Install 'windows-curses' on Windows for full UI later.")
-	finally:
-		_fallback_banner_printed = True
+	_fallback_banner_printed = True
 
 
 def _choose_difficulty() -> Path | None:  # pragma: no cover - user interaction
@@ -373,9 +498,7 @@ def _try_realtime_session(cfg: ModeConfig) -> SessionResult:
 	on backspace (limitation). Future refinement will reconcile per-word commit
 	accuracy with live updates.
 	"""
-	try:
-		__import__("curses")  # type: ignore  # imported for availability check
-	except Exception:  # curses not available
+	if not _probe_curses():  # curses not available
 		return run_session(cfg)
 	try:
 		return _run_session_curses(cfg)
@@ -384,19 +507,53 @@ def _try_realtime_session(cfg: ModeConfig) -> SessionResult:
 		return run_session(cfg)
 
 
+# Outcomes of _process_key
+_KEY_EDIT = 0
+_KEY_COMMIT = 1
+_KEY_QUIT = 2
+
+
+def _process_key(stats: LiveStats, target: str, typed: str, key: int, now: float) -> tuple[str, int]:
+	"""Apply one curses key to the current word; return (new_typed, outcome).
+
+	Kept free of screen and loop state so the per-keystroke path is a single
+	plain function (and a candidate for compilation with mypyc/Cython).
+	"""
+	if key == 10 or key == 13:  # Enter key (CR or LF); normalize_key maps it to None
+		token = " "
+	else:
+		token = normalize_key(key)
+	if token == "BACKSPACE":
+		return typed[:-1], _KEY_EDIT
+	if token is None or token == "RESIZE":  # size is re-read every frame anyway
+		return typed, _KEY_EDIT
+	if token == "/":  # allow /quit prefix style; collected without scoring
+		return typed + "/", _KEY_EDIT
+	if token == "q" and not typed:  # quick quit if no current typing
+		return typed, _KEY_QUIT
+	if token == " ":
+		# commit word
+		_commit_word(stats, target, typed, now)
+		update_on_char(stats, True, now)  # space char baseline
+		return "", _KEY_COMMIT
+	# normal char
+	idx = len(typed)
+	update_on_char(stats, idx < len(target) and token == target[idx], now)
+	# Wait for an explicit space rather than auto-committing, to mimic plain mode
+	return typed + token, _KEY_EDIT
+
+
 def _run_session_curses(cfg: ModeConfig) -> SessionResult:  # pragma: no cover - interactive
 	validate_mode_config(cfg)
-	if cfg.timed_seconds is not None:
-		mode = build_timed_mode(cfg.timed_seconds, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path, top_n_highscores=cfg.top_n_highscores)
-	else:
-		assert cfg.word_count is not None
-		mode = build_word_count_mode(cfg.word_count, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path, top_n_highscores=cfg.top_n_highscores)
+	mode = _build_mode(cfg)
 
 	# Initialize state
 	started = time.monotonic()
 	stats = LiveStats(started_at=started, last_update=started)
 	words_iter = _iterate_mode_words(mode)
 	targets: list[str] = []
+	# Fill the lookahead before the first frame so the loop never starts cold
+	_refill(targets, words_iter)
 	current_index = 0
 	typed_current = ""
 	word_started_at = started
@@ -405,21 +562,26 @@ def _run_session_curses(cfg: ModeConfig) -> SessionResult:  # pragma: no cover -
 		# If fallback (scr is None) revert to plain
 		if scr is None:
 			return run_session(cfg)
-		scr.nodelay(True)
+		# Block in getch for up to 50ms instead of spinning; that also paces
+		# the idle refresh of the time readout at the header's 20Hz
+		scr.timeout(50)
 		curses = __import__("curses")  # local ref
+		# Header/bar text only changes visibly at ~20Hz unless a key lands
+		header_throttle = UIThrottle(0.05)
+		header = bar = ""
+		last_frame = None  # (target, typed, index, cols, lines) of the last full draw
+		wrap_key = None  # (index, visible words, cols) that `wrapped` was built for
+		wrapped: list[str] = []
+		now = started
 		while True:
-			now = time.monotonic()
 			# End conditions
 			if cfg.timed_seconds is not None and elapsed_seconds(stats, now) >= cfg.timed_seconds:
 				break
 			if cfg.word_count is not None and current_index >= cfg.word_count:
 				break
-			# Ensure we have enough upcoming words
-			while len(targets) <= current_index + 25:
-				try:
-					targets.append(next(words_iter))
-				except StopIteration:
-					break
+			# Ensure we have enough upcoming words (batched; no-op once exhausted)
+			if len(targets) <= current_index + 25:
+				_refill(targets, words_iter)
 			target = targets[current_index]
 
 			# Input handling
@@ -427,104 +589,76 @@ def _run_session_curses(cfg: ModeConfig) -> SessionResult:  # pragma: no cover -
 				key = scr.getch()
 			except Exception:
 				key = -1
+			# One clock read per iteration, taken after the blocking wait and
+			# shared by input handling, rendering and the next end-condition check.
+			# Same clock as time.monotonic(); the integer form feeds the throttle
+			now_ns = time.monotonic_ns()
+			now = now_ns / 1_000_000_000
 			if key != -1:
-				token = normalize_key(key)
-				if token == "BACKSPACE":
-					if typed_current:
-						typed_current = typed_current[:-1]
-				elif token is None:
-					pass
-				elif token == "/":  # allow /quit prefix style
-					# collect command quickly
-					typed_current += "/"
-				elif token == "q" and not typed_current:  # quick quit if no current typing
+				typed_current, action = _process_key(stats, target, typed_current, key, now)
+				if action == _KEY_QUIT:
 					break
-				elif key == 10 or key == 13:  # Enter key (CR or LF)
-					# commit word on Enter press
-					_commit_word(stats, target, typed_current)
-					update_on_char(stats, True)  # space char baseline
+				if action == _KEY_COMMIT:
 					current_index += 1
 					# record per-word duration
-					w_dur = time.monotonic() - word_started_at
+					w_dur = now - word_started_at
 					if w_dur >= 0:
 						stats.word_durations.append(w_dur)
-					word_started_at = time.monotonic()
-					typed_current = ""
-				elif token == " ":
-					# commit word
-					_commit_word(stats, target, typed_current)
-					update_on_char(stats, True)  # space char baseline
-					current_index += 1
-					# record per-word duration
-					w_dur = time.monotonic() - word_started_at
-					if w_dur >= 0:
-						stats.word_durations.append(w_dur)
-					word_started_at = time.monotonic()
-					typed_current = ""
-				else:
-					# normal char
-					ch = token
-					idx = len(typed_current)
-					correct = idx < len(target) and ch == target[idx]
-					update_on_char(stats, correct)
-					typed_current += ch
-					# auto commit if full length typed and next key not needed
-					if len(typed_current) >= len(target):
-						# Wait for space OR auto-commit? We'll wait for explicit space to mimic plain mode.
-						pass
+					word_started_at = now
+					# Render the next word this frame, not the one just committed
+					if current_index < len(targets):
+						target = targets[current_index]
 
 			# Rendering
-			scr.erase()
+			cols = curses.COLS
+			lines = curses.LINES
+			prev_header = header
 			# Header
-			elapsed = elapsed_seconds(stats, now)
-			raw_wpm = compute_raw_wpm(stats, now)
-			net_wpm = compute_net_wpm(stats, now)
-			acc = stats.accuracy() * 100
-			if cfg.timed_seconds is not None:
-				prog = elapsed / cfg.timed_seconds if cfg.timed_seconds else 0
-				mode_desc = f"Timed {cfg.timed_seconds}s"
-			else:
-				prog = current_index / cfg.word_count if cfg.word_count else 0
-				mode_desc = f"Words {cfg.word_count}"
-			bar = build_progress_bar(prog, max(10, min(30, curses.COLS - 60)))
-			header = build_header_line(mode_desc, elapsed, net_wpm, stats.accuracy(), stats.errors)
-			scr.addnstr(0, 0, header, curses.COLS - 1)
-			scr.addnstr(1, 0, bar, curses.COLS - 1)
-
-			# Word area: render upcoming words list
-			display_words = [target] + targets[current_index + 1: current_index + 15]
-			# For compact list view, render current word unstyled, we'll draw styled overlay below
-			wrapped = wrap_words(display_words, max(20, curses.COLS - 2))
-			for i, line in enumerate(wrapped[: curses.LINES - 4]):
-				scr.addnstr(3 + i, 0, line, curses.COLS - 1)
+			if header_throttle.should_render(now_ns) or key != -1 or not header:
+				elapsed = elapsed_seconds(stats, now)
+				net_wpm = compute_net_wpm(stats, now)
+				if cfg.timed_seconds is not None:
+					prog = elapsed / cfg.timed_seconds if cfg.timed_seconds else 0
+					mode_desc = f"Timed {cfg.timed_seconds}s"
+				else:
+					prog = current_index / cfg.word_count if cfg.word_count else 0
+					mode_desc = f"Words {cfg.word_count}"
+				bar = build_progress_bar(prog, max(10, min(30, cols - 60)))
+				header = build_header_line(mode_desc, elapsed, net_wpm, stats.accuracy(), stats.errors)
+			frame = (target, typed_current, current_index, cols, lines)
+			if frame == last_frame:
+				# Word area unchanged: repaint just the header rows if their text moved on
+				if header != prev_header:
+					scr.move(0, 0)
+					scr.clrtoeol()
+					scr.addnstr(0, 0, header, cols - 1)
+					scr.move(1, 0)
+					scr.clrtoeol()
+					scr.addnstr(1, 0, bar, cols - 1)
+					scr.refresh()
+				continue
+			last_frame = frame
+			scr.erase()
+			scr.addnstr(0, 0, header, cols - 1)
+			scr.addnstr(1, 0, bar, cols - 1)
+
+			# Word area: render upcoming words list (rewrapped only when the window moves)
+			key_now = (current_index, min(len(targets), current_index + 15), cols)
+			if key_now != wrap_key:
+				wrap_key = key_now
+				display_words = targets[current_index: current_index + 15]
+				# For compact list view, render current word unstyled, we'll draw styled overlay below
+				wrapped = wrap_words(display_words, max(20, cols - 2))
+			for i, line in enumerate(wrapped[: lines - 4]):
+				scr.addnstr(3 + i, 0, line, cols - 1)
 
 			# Overlay: prominently show the current word with live caret and colors
 			# Place it just above the word list area
 			draw_highlighted_word(scr, 2, 0, target, typed_current)
 			scr.refresh()
-			# Sleep a tiny bit to reduce CPU spin
-			time.sleep(0.01)
 
 	# Final commit if user typed something but didn't press space (optional)
 	if typed_current:
 		_commit_word(stats, target, typed_current)
-	# Build result (reuse code path via record)
-	elapsed = elapsed_seconds(stats)
-	raw_wpm = compute_raw_wpm(stats)
-	net_wpm = compute_net_wpm(stats)
-	acc = stats.accuracy()
-	key = mode_key(cfg)
-	prev_best: Optional[float] = None
-	try:
-		store = load_highscores()
-		if key in store and store[key]:
-			prev_best = max((e.wpm for e in store[key]), default=None)
-	except Exception:
-		pass
-	# Only record highscore if it's an improvement or first attempt
-	highscore_new = False
-	if prev_best is None or net_wpm > prev_best:
-		entry = HighScoreEntry.create(key, net_wpm, acc, raw_wpm, stats.errors, stats.chars_typed)
-		highscore_new = record_highscore(key, entry, top_n=cfg.top_n_highscores)
-	consistency = compute_consistency(stats)
-	return SessionResult(cfg, raw_wpm, net_wpm, acc, stats.errors, stats.chars_typed, elapsed, highscore_new, previous_best_net_wpm=prev_best, consistency=consistency)
+	# Build result (shared with the plain-mode runner)
+	return _finish_session(cfg, stats, time.monotonic())
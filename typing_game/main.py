@@ -1,92 +1,231 @@
-"""CLI entrypoint.
+"""CLI entrypoint (Section 13).
 
-Implements Section 13 of the plan:
- - argparse with --timed / --words / --list / --punct / --numbers / --show-highscores
- - Interactive menu if no mode args supplied
- - Dispatch to engine
+Features:
+ - argparse interface (--timed / --words are mutually exclusive)
+ - optional modifiers: --punct, --numbers, --list WORDLIST
+ - --show-highscores to list stored highscores and exit
+ - falls back to an interactive menu when no action arguments supplied
+ - persists last used configuration
 
-Later milestones will add curses real-time UI; this CLI presently runs the line-based prototype engine.
+The root-level ``main.py`` is a thin shim around :func:`main`.
+
+Usage examples:
+  python main.py --timed 60 --punct 0.1 --numbers
+  python main.py --words 50
+  python main.py --show-highscores
 """
 
 from __future__ import annotations
 
-import argparse
-from typing import Optional
-
-from .config import ModeConfig, default_config, merge_cli_args
-from .engine import end_screen, run_session
-from .storage import get_top_highscores, load_highscores
-
-
+import os
+import sys
+from typing import TYPE_CHECKING, Callable, Optional
+
+from .config import (
+	ModeConfig,
+	load_last_config,
+	merge_cli_args,
+	get_or_create_config_path,
+	save_last_config,
+)
+
+if TYPE_CHECKING:  # heavy imports deferred to first use to keep startup fast
+	import argparse
+
+
+# ----------------------------- Highscore Helpers -----------------------------
+def print_highscores(limit: int = 25):  # pragma: no cover - output helper
+	from .storage import get_top_highscores, load_highscores
+
+	lines = ["=== Highscores ==="]
+	store = load_highscores()
+	if not store:
+		lines.append("(none recorded yet)")
+		sys.stdout.write("\n".join(lines) + "\n")
+		return
+	# Sort mode keys alphabetically for stable display
+	for mk in sorted(store.keys()):
+		ordered = get_top_highscores(mk, limit)
+		lines.append(f"-- {mk} (top {len(ordered)}) --")
+		for i, e in enumerate(ordered, 1):
+			lines.append(f" {i:2d}. net={e.wpm:.2f} raw={e.raw_wpm:.2f} acc={e.accuracy*100:.1f}% errors={e.errors} chars={e.total_chars} time={e.timestamp}")
+	lines.append("==================")
+	# Single write instead of one print per line
+	sys.stdout.write("\n".join(lines) + "\n")
+
+
+# ------------------------------- Interactive Menu ----------------------------
+def interactive_menu(base_cfg: ModeConfig, *, config_exists: bool) -> ModeConfig:  # pragma: no cover - interactive
+	# Determine default timed seconds: last used if config exists, else 15s
+	selected_timed = base_cfg.timed_seconds if (config_exists and base_cfg.timed_seconds) else 15
+
+	def start_timed() -> ModeConfig:
+		return ModeConfig(timed_seconds=selected_timed, word_count=None, punctuation_prob=base_cfg.punctuation_prob, numbers=base_cfg.numbers, wordlist_path=base_cfg.wordlist_path, top_n_highscores=base_cfg.top_n_highscores)
+
+	def timed_submenu() -> ModeConfig | None:
+		nonlocal selected_timed
+		while True:
+			print(
+				"\n-- Timed Session --\n"
+				f"Selected: {selected_timed}s\n"
+				" 1) 15s    2) 30s    3) 60s    4) Custom\n"
+				" S) Start   B) Back"
+			)
+			sub = input("Choose: ").strip().lower()
+			if sub == "1":
+				selected_timed = 15
+			elif sub == "2":
+				selected_timed = 30
+			elif sub == "3":
+				selected_timed = 60
+			elif sub == "4":
+				val = input("Enter seconds: ").strip()
+				try:
+					secs = int(val)
+					if secs > 0:
+						selected_timed = secs
+					else:
+						print("Must be > 0")
+				except ValueError:
+					print("Invalid integer")
+			elif sub == "s":
+				return start_timed()
+			elif sub in {"b", "back"}:
+				return None
+			else:
+				print("Unknown option")
+
+	def word_count_session() -> ModeConfig | None:
+		val = input("Word count (e.g. 50): ").strip()
+		try:
+			wc = int(val)
+		except ValueError:
+			print("Invalid integer.")
+			return None
+		return ModeConfig(timed_seconds=None, word_count=wc, punctuation_prob=base_cfg.punctuation_prob, numbers=base_cfg.numbers, wordlist_path=base_cfg.wordlist_path, top_n_highscores=base_cfg.top_n_highscores)
+
+	def set_punctuation() -> None:
+		val = input("New punctuation probability [0-1]: ").strip()
+		try:
+			prob = float(val)
+			if 0 <= prob <= 1:
+				base_cfg.punctuation_prob = prob
+			else:
+				print("Out of range")
+		except ValueError:
+			print("Invalid float")
+
+	def toggle_numbers() -> None:
+		base_cfg.numbers = not base_cfg.numbers
+
+	def change_difficulty() -> None:
+		from .engine import _choose_difficulty
+
+		new_wordlist = _choose_difficulty()
+		if new_wordlist is not None:
+			base_cfg.wordlist_path = new_wordlist
+
+	def quit_menu() -> None:
+		raise SystemExit(0)
+
+	# Handlers return a ModeConfig to start a session, or None to stay in the menu
+	handlers: dict[str, Callable[[], ModeConfig | None]] = {
+		"1": timed_submenu,
+		"2": word_count_session,
+		"3": print_highscores,
+		"4": set_punctuation,
+		"5": toggle_numbers,
+		"6": change_difficulty,
+		"s": start_timed,
+		"q": quit_menu,
+		"quit": quit_menu,
+		"exit": quit_menu,
+	}
+
+	while True:
+		# One print per redraw; each print is a separate write on slow consoles
+		print(
+			"\n=== Typing Game Menu ===\n"
+			f"1) Timed session [{selected_timed}s]\n"
+			"2) Word count session\n"
+			"3) Show highscores\n"
+			f"4) Toggle punctuation (currently: {base_cfg.punctuation_prob:.2f})\n"
+			f"5) Toggle numbers (currently: {'ON' if base_cfg.numbers else 'OFF'})\n"
+			f"6) Change difficulty (currently: {base_cfg.wordlist_path.name if base_cfg.wordlist_path else '<default>'})\n"
+			f"S) Start [Timed {selected_timed}s]\n"
+			"Q) Quit"
+		)
+		choice = input("Select: ").strip().lower()
+		handler = handlers.get(choice)
+		if handler is None:
+			print("Unknown option")
+			continue
+		res = handler()
+		if res is not None:
+			return res
+
+
+# --------------------------------- Argparse ---------------------------------
 def build_parser() -> argparse.ArgumentParser:
-    p = argparse.ArgumentParser(prog="typing-game", description="Terminal typing game (prototype)")
-    mode = p.add_mutually_exclusive_group()
-    mode.add_argument("--timed", type=int, help="Timed mode: seconds")
-    mode.add_argument("--words", type=int, help="Word-count mode: number of words")
-    p.add_argument("--list", dest="list", help="Custom word list file path")
-    p.add_argument("--punct", type=float, help="Punctuation probability 0..1")
-    p.add_argument("--numbers", action="store_true", help="Enable occasional number substitution")
-    p.add_argument("--show-highscores", action="store_true", help="Show highscores then exit")
-    return p
-
-
-def print_highscores(limit: int = 10):  # pragma: no cover - output
-    store = load_highscores()
-    if not store:
-        print("No highscores yet.")
-        return
-    print("=== Highscores ===")
-    for mode_key, _entries in store.items():  # loop variable unused
-        print(f"[{mode_key}]")
-        ordered = get_top_highscores(mode_key, limit=limit)
-        for i, e in enumerate(ordered, 1):
-            print(f" {i:2d}. {e.wpm:6.2f} WPM (net) acc {e.accuracy*100:5.1f}% raw {e.raw_wpm:6.2f} errors {e.errors} {e.timestamp}")
-    print("==================")
-
-
-def interactive_menu():  # pragma: no cover - user interaction
-    cfg = default_config()
-    while True:
-        print("\nTyping Game Menu")
-        print("1) Timed 60s")
-        print("2) Words 50")
-        print("3) Show highscores")
-        print("Q) Quit")
-        choice = input("> ").strip().lower()
-        if choice == "1":
-            cfg = ModeConfig(timed_seconds=60, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path)
-            res = run_session(cfg)
-            end_screen(res)
-        elif choice == "2":
-            cfg = ModeConfig(word_count=50, punctuation_prob=cfg.punctuation_prob, numbers=cfg.numbers, wordlist_path=cfg.wordlist_path)
-            res = run_session(cfg)
-            end_screen(res)
-        elif choice == "3":
-            print_highscores()
-        elif choice.startswith("q"):
-            break
-        else:
-            print("Invalid option.")
-
-
-def main(argv: Optional[list[str]] = None):  # pragma: no cover - integration
-    parser = build_parser()
-    args = parser.parse_args(argv)
-    cfg = default_config()
-
-    if args.show_highscores:
-        print_highscores()
-        return
-
-    # If neither timed nor words provided → interactive menu
-    if args.timed is None and args.words is None:
-        interactive_menu()
-        return
-
-    cfg = merge_cli_args(cfg, args)
-    res = run_session(cfg)
-    end_screen(res)
+	import argparse
+
+	parser = argparse.ArgumentParser(description="Typing game CLI")
+	group = parser.add_mutually_exclusive_group()
+	group.add_argument("--timed", type=int, help="Run a timed session (seconds)")
+	group.add_argument("--words", type=int, help="Run a fixed word-count session")
+	parser.add_argument("--punct", type=float, help="Punctuation probability [0-1]")
+	parser.add_argument("--numbers", action="store_true", help="Enable number replacements")
+	parser.add_argument("--list", metavar="WORDLIST", help="Path to custom word list file")
+	parser.add_argument("--show-highscores", action="store_true", help="Display highscores and exit")
+	return parser
+
+
+def args_provided(ns: argparse.Namespace) -> bool:
+	return any(
+		getattr(ns, name) is not None
+		for name in ["timed", "words", "punct", "list"]
+	) or ns.numbers or ns.show_highscores
+
+
+def run_from_args(ns: argparse.Namespace, last_cfg: ModeConfig):  # pragma: no cover - orchestration
+	if ns.show_highscores:
+		print_highscores()
+		return
+	from .engine import interactive_loop
+
+	# If no specific args (like --timed) passed, go interactive menu
+	if not args_provided(ns):
+		cfg_path = get_or_create_config_path()
+		cfg = interactive_menu(last_cfg, config_exists=cfg_path.exists())
+	else:
+		cfg = merge_cli_args(last_cfg, ns)
+	interactive_loop(cfg)
+	# persist last used config (post any interactive menu tweaks)
+	save_last_config(cfg)
+
+
+def main(argv: Optional[list[str]] = None):  # pragma: no cover - user interactive
+	last_cfg = load_last_config()
+	parser = build_parser()
+	ns = parser.parse_args(argv)
+	# Fallback warning if curses missing (Section 14); not needed for listing scores
+	if not ns.show_highscores:
+		try:
+			import curses  # noqa: F401
+		except Exception:
+			print("[Fallback] curses not available. Running in plain line mode.")
+			if os.name == "nt":
+				print("Hint: pip install windows-curses for full UI.")
+	try:
+		run_from_args(ns, last_cfg)
+	except ValueError as e:
+		# Provide a concise, user-friendly error then exit with non‑zero code.
+		print(f"Error: {e}")
+		if "wordlist path" in str(e).lower():
+			print("Tip: supply an existing file path, e.g. --list C:/path/to/words.txt")
+			print("If you intended to use default built-in list, omit --list.")
+		exit(1)
 
 
 if __name__ == "__main__":  # manual launch support
-    main()
+	main()
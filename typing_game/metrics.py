@@ -17,8 +17,11 @@ Many platforms show both; we will compute both for later UI display.
 
 from __future__ import annotations
 
+import math
 import time
+from array import array
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 
 from .config import ModeConfig
@@ -27,6 +30,7 @@ __all__ = [
 	"LiveStats",
 	"make_mode_key",
 	"update_on_char",
+	"update_on_chars",
 	"compute_raw_wpm",
 	"compute_net_wpm",
 	"elapsed_seconds",
@@ -42,12 +46,12 @@ class LiveStats:
 	errors: int = 0
 	correct_chars: int = 0
 	finished: bool = False
-	word_durations: list[float] = field(default_factory=list)  # consistency placeholder
+	# Unboxed doubles; append/len/iteration behave like the former list[float]
+	word_durations: array = field(default_factory=lambda: array("d"))  # consistency placeholder
 
 	def accuracy(self) -> float:
-		if self.chars_typed == 0:
-			return 0.0
-		return self.correct_chars / self.chars_typed
+		n = self.chars_typed
+		return self.correct_chars / n if n else 0.0
 
 
 def elapsed_seconds(stats: LiveStats, now: Optional[float] = None) -> float:
@@ -75,6 +79,20 @@ def update_on_char(stats: LiveStats, correct: bool, now: Optional[float] = None)
 		stats.errors += 1
 
 
+def update_on_chars(stats: LiveStats, n_correct: int, n_total: int, now: Optional[float] = None) -> None:
+	"""Batch form of :func:`update_on_char` for ``n_total`` characters at once.
+
+	Equivalent to ``n_correct`` correct and ``n_total - n_correct`` wrong
+	single-character updates, but touches the clock and stats fields once.
+	"""
+	if now is None:
+		now = time.monotonic()
+	stats.last_update = now
+	stats.chars_typed += n_total
+	stats.correct_chars += n_correct
+	stats.errors += n_total - n_correct
+
+
 def _minutes(elapsed: float) -> float:
 	return elapsed / 60.0 if elapsed > 0 else 0.0
 
@@ -104,14 +122,23 @@ def compute_consistency(stats: LiveStats) -> float:
 
 	This is an initial placeholder and can be refined (e.g. rolling windows,
 	per-word wpm variance) in future enhancements.
+
+	Plain float accumulation is used instead of statistics.pstdev, whose exact
+	(Fraction-based) summation is far slower; for a handful of per-word
+	durations the rounding difference is well below what the UI displays.
 	"""
-	from statistics import pstdev
-	if len(stats.word_durations) < 2:
+	n = len(stats.word_durations)
+	if n < 2:
 		return 0.0
-	mean = sum(stats.word_durations) / len(stats.word_durations)
+	# Single pass: accumulate sum and sum of squares together
+	s = ss = 0.0
+	for d in stats.word_durations:
+		s += d
+		ss += d * d
+	mean = s / n
 	if mean <= 0:
 		return 0.0
-	stdev = pstdev(stats.word_durations)
+	stdev = math.sqrt(max(0.0, ss / n - mean * mean))
 	cv = stdev / mean if mean else 0.0
 	return max(0.0, min(1.0, 1.0 - cv))
 
@@ -124,10 +151,21 @@ def make_mode_key(cfg: ModeConfig) -> str:
 	  words-50-p10-n1
 	Where p is punctuation_prob * 100 (int), n is numbers flag 0/1.
 	"""
-	if cfg.timed_seconds is not None:
-		base = f"timed-{cfg.timed_seconds}"
+	# ModeConfig is mutable (menus edit it in place), so cache on its fields
+	return _mode_key_for(cfg.timed_seconds, cfg.word_count, cfg.punctuation_prob, cfg.numbers)
+
+
+@lru_cache(maxsize=128)
+def _mode_key_for(
+	timed_seconds: Optional[int],
+	word_count: Optional[int],
+	punctuation_prob: float,
+	numbers: bool,
+) -> str:
+	if timed_seconds is not None:
+		base = f"timed-{timed_seconds}"
 	else:
-		base = f"words-{cfg.word_count}"
-	p = int(round(cfg.punctuation_prob * 100))
-	n = 1 if cfg.numbers else 0
+		base = f"words-{word_count}"
+	p = int(round(punctuation_prob * 100))
+	n = 1 if numbers else 0
 	return f"{base}-p{p}-n{n}"
@@ -17,6 +17,7 @@ __all__ = [
 	"build_word_count_mode",
 	"Mode",
 	"mode_key",
+	"seed",
 ]
 
 
@@ -72,16 +73,26 @@ class _WordCountMode:
 		return self._index >= len(self._words_list)
 
 
-def build_timed_mode(seconds: int, **kwargs) -> Mode:
+# One OS-seeded generator shared by all modes; seeding a fresh Random()
+# per build costs an os.urandom read each time.
+_DEFAULT_RNG = Random()
+
+
+def seed(value: int | None = None) -> None:
+	"""Reseed the shared default RNG (e.g. for reproducible tests)."""
+	_DEFAULT_RNG.seed(value)
+
+
+def build_timed_mode(seconds: int, *, rng: Random | None = None, **kwargs) -> Mode:
 	cfg = ModeConfig(timed_seconds=seconds, **kwargs)
 	validate_mode_config(cfg)
-	return _TimedMode(cfg, Random())
+	return _TimedMode(cfg, rng or _DEFAULT_RNG)
 
 
-def build_word_count_mode(count: int, **kwargs) -> Mode:
+def build_word_count_mode(count: int, *, rng: Random | None = None, **kwargs) -> Mode:
 	cfg = ModeConfig(word_count=count, **kwargs)
 	validate_mode_config(cfg)
-	return _WordCountMode(cfg, Random())
+	return _WordCountMode(cfg, rng or _DEFAULT_RNG)
 
 
 def mode_key(cfg: ModeConfig) -> str:
@@ -17,26 +17,40 @@ import sys
 from pathlib import Path
 from functools import lru_cache
 
-_SOUNDS_DIR: Path | None = None
-
-
-def _project_root() -> Path:
-    # typing_game/sound.py -> typing_game -> project root
-    return Path(__file__).resolve().parent.parent
+# typing_game/sound.py -> typing_game -> project root; resolved once at import.
+# Only wav files that exist are kept, so lookups need no filesystem access.
+_SOUNDS_DIR = Path(__file__).resolve().parent.parent / "sounds"
+_WAV: dict[str, Path] = {
+    kind: p
+    for kind, p in (("correct", _SOUNDS_DIR / "correct.wav"), ("wrong", _SOUNDS_DIR / "wrong.wav"))
+    if p.exists()
+}
+
+
+@lru_cache(maxsize=1)
+def _winsound():
+    # Resolved once; repeated plays skip the import machinery
+    try:
+        import winsound  # type: ignore
+    except Exception:
+        return None
+    return winsound
 
 
-def _sounds_dir() -> Path:
-    global _SOUNDS_DIR
-    if _SOUNDS_DIR is None:
-        _SOUNDS_DIR = _project_root() / "sounds"
-    return _SOUNDS_DIR
+@lru_cache(maxsize=1)
+def _simpleaudio():
+    try:
+        import simpleaudio as sa  # type: ignore
+    except Exception:
+        return None
+    return sa
 
 
 @lru_cache(maxsize=2)
-def _sound_path(kind: str) -> Path | None:
-    name = "correct.wav" if kind == "correct" else "wrong.wav"
-    p = _sounds_dir() / name
-    return p if p.exists() else None
+def _wave_object(path: Path):
+    # Decoding the wav is the expensive part; play() on the cached object
+    # reuses its in-memory buffer
+    return _simpleaudio().WaveObject.from_wave_file(str(path))
 
 
 def _play_async(path: Path) -> None:
@@ -47,19 +61,19 @@ def _play_async(path: Path) -> None:
     """
     try:
         if sys.platform.startswith("win"):  # Windows
-            import winsound  # type: ignore
+            winsound = _winsound()
+            if winsound is None:
+                return
             flags = winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT
-            # winsound will return immediately with SND_ASYNC
+            # winsound will return immediately with SND_ASYNC (which it
+            # refuses to combine with SND_MEMORY, so playback stays file-based)
             winsound.PlaySound(str(path), flags)
             return
         # Non-Windows: try simpleaudio
-        try:
-            import simpleaudio as sa  # type: ignore
-        except Exception:
+        if _simpleaudio() is None:
             return  # no-op if not available
         try:
-            wave_obj = sa.WaveObject.from_wave_file(str(path))
-            wave_obj.play()  # returns immediately
+            _wave_object(path).play()  # returns immediately
         except Exception:
             pass
     except Exception:
@@ -68,12 +82,12 @@ def _play_async(path: Path) -> None:
 
 
 def play_correct() -> None:
-    p = _sound_path("correct")
+    p = _WAV.get("correct")
     if p is not None:
         _play_async(p)
 
 
 def play_wrong() -> None:
-    p = _sound_path("wrong")
+    p = _WAV.get("wrong")
     if p is not None:
         _play_async(p)
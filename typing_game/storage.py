@@ -7,6 +7,10 @@ Section 5 implementation:
  - Truncate list per mode to top N (configurable)
  - Atomic write using temp file then replace
  - record_highscore(mode_key, entry) API returning bool if entry kept
+ - In-process cache of the parsed store, reused while the file is unchanged
+ - get_best_wpm(mode_key) O(1) previous-best lookup backed by that cache
+ - queue_highscore(mode_key, entry) deferred variant: writes at most every
+   FLUSH_INTERVAL seconds, with pending entries flushed at interpreter exit
 
 Data format on disk (JSON):
 {
@@ -21,13 +25,20 @@ Data format on disk (JSON):
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
-from dataclasses import dataclass
-from datetime import UTC, datetime
+import time
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:  # optional faster JSON backend
+	import orjson  # type: ignore
+except ImportError:  # pragma: no cover - fallback path
+	orjson = None  # type: ignore[assignment]
+
 __all__ = [
 	"HighScoreEntry",
 	"get_highscores_path",
@@ -35,9 +46,15 @@ __all__ = [
 	"save_highscores",
 	"insert_entry",
 	"record_highscore",
+	"queue_highscore",
+	"flush_highscores",
 	"get_top_highscores",
+	"get_best_wpm",
 ]
 
+# Minimum seconds between deferred highscore writes (see queue_highscore).
+FLUSH_INTERVAL = 5.0
+
 
 @dataclass(slots=True)
 class HighScoreEntry:
@@ -48,11 +65,13 @@ class HighScoreEntry:
 	errors: int
 	total_chars: int
 	timestamp: str  # ISO8601
+	# Serialized form, built on first to_dict(); entries are never mutated after creation
+	_dict: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
 
 	@staticmethod
 	def create(mode_key: str, wpm: float, accuracy: float, raw_wpm: float, errors: int, total_chars: int) -> "HighScoreEntry":
 		# Use 'Z' suffix for UTC to satisfy tests expecting trailing Z.
-		iso = datetime.now(UTC).replace(tzinfo=UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+		iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 		return HighScoreEntry(
 			mode_key=mode_key,
 			wpm=round(wpm, 2),
@@ -64,15 +83,19 @@ class HighScoreEntry:
 		)
 
 	def to_dict(self) -> dict[str, Any]:
-		return {
-			"mode_key": self.mode_key,
-			"wpm": self.wpm,
-			"accuracy": self.accuracy,
-			"raw_wpm": self.raw_wpm,
-			"errors": self.errors,
-			"total_chars": self.total_chars,
-			"timestamp": self.timestamp,
-		}
+		"""Return the JSON form of this entry (cached; treat as read-only)."""
+		d = self._dict
+		if d is None:
+			d = self._dict = {
+				"mode_key": self.mode_key,
+				"wpm": self.wpm,
+				"accuracy": self.accuracy,
+				"raw_wpm": self.raw_wpm,
+				"errors": self.errors,
+				"total_chars": self.total_chars,
+				"timestamp": self.timestamp,
+			}
+		return d
 
 	@staticmethod
 	def from_dict(d: dict[str, Any]) -> "HighScoreEntry":
@@ -107,12 +130,91 @@ def _empty_store() -> dict[str, list[HighScoreEntry]]:
 	return {}
 
 
+# Parsed stores per file, reused while the file's (mtime_ns, size) is unchanged.
+_STORE_CACHE: dict[Path, tuple[tuple[int, int], dict[str, list[HighScoreEntry]]]] = {}
+# Best net WPM per mode key for each cached file, kept in step with _STORE_CACHE.
+_BEST_BY_KEY: dict[Path, dict[str, float]] = {}
+# Stores with queued entries not yet written; these take precedence over disk.
+_DIRTY: dict[Path, dict[str, list[HighScoreEntry]]] = {}
+_last_flush = 0.0
+
+
+def _file_signature(p: Path) -> tuple[int, int] | None:
+	try:
+		st = p.stat()
+	except OSError:
+		return None
+	return (st.st_mtime_ns, st.st_size)
+
+
+def _copy_store(store: dict[str, list[HighScoreEntry]]) -> dict[str, list[HighScoreEntry]]:
+	# Callers (insert_entry) mutate lists in place; never hand out cached ones
+	return {k: list(lst) for k, lst in store.items()}
+
+
+def _best_by_key(store: dict[str, list[HighScoreEntry]]) -> dict[str, float]:
+	return {k: max(e.wpm for e in lst) for k, lst in store.items() if lst}
+
+
+def _cache_store(p: Path, sig: tuple[int, int], store: dict[str, list[HighScoreEntry]]) -> None:
+	# Establish the best-first order insert_entry and _ranks_below_cutoff rely
+	# on (the file may have been edited by hand); near-free if already sorted
+	for lst in store.values():
+		lst.sort(key=_rank_key)
+	_STORE_CACHE[p] = (sig, store)
+	_BEST_BY_KEY[p] = _best_by_key(store)
+
+
+def _ranks_below_cutoff(p: Path, entry: HighScoreEntry, top_n: int) -> bool:
+	"""True if ``entry`` is known (from memory) to miss a full top_n list.
+
+	Only consults stores that are pending or whose cached signature still
+	matches the file; anything uncertain returns False and takes the slow path.
+	"""
+	store = _DIRTY.get(p)
+	if store is None:
+		cached = _STORE_CACHE.get(p)
+		if cached is None or cached[0] != _file_signature(p):
+			return False
+		store = cached[1]
+	lst = store.get(entry.mode_key)
+	if not lst or len(lst) < top_n:
+		return False
+	cutoff = lst[top_n - 1]  # best-first: sorted when cached, kept so by insert_entry
+	# A tie loses: the new entry has the newest timestamp
+	return (entry.wpm, entry.accuracy) <= (cutoff.wpm, cutoff.accuracy)
+
+
+def _fsync_dir(d: Path) -> None:
+	# Persist the rename itself; directories can't be opened this way on Windows
+	if not hasattr(os, "O_DIRECTORY"):
+		return
+	try:
+		fd = os.open(d, os.O_RDONLY | os.O_DIRECTORY)
+	except OSError:
+		return
+	try:
+		os.fsync(fd)
+	except OSError:
+		pass
+	finally:
+		os.close(fd)
+
+
 def load_highscores(path: Path | None = None) -> dict[str, list[HighScoreEntry]]:
 	p = get_highscores_path(path)
-	if not p.exists():
+	pending = _DIRTY.get(p)
+	if pending is not None:  # queued entries not yet on disk
+		return _copy_store(pending)
+	sig = _file_signature(p)
+	if sig is None:
 		return _empty_store()
+	cached = _STORE_CACHE.get(p)
+	if cached is not None and cached[0] == sig:
+		return _copy_store(cached[1])
 	try:
-		raw = json.loads(p.read_text(encoding="utf-8"))
+		# Both backends accept bytes, skipping a separate utf-8 decode
+		raw = (orjson or json).loads(p.read_bytes())
 		modes = raw.get("modes", {}) if isinstance(raw, dict) else {}
 		out: dict[str, list[HighScoreEntry]] = {}
 		for k, lst in modes.items():
@@ -126,19 +228,48 @@ def load_highscores(path: Path | None = None) -> dict[str, list[HighScoreEntry]]
 					except TypeError:
 						continue
 			out[k] = entries
-		return out
+		_cache_store(p, sig, out)  # sorts each list best-first
+		return _copy_store(out)
 	except Exception:
 		return _empty_store()
 
 
-def save_highscores(data: dict[str, list[HighScoreEntry]], path: Path | None = None) -> None:
+def save_highscores(
+	data: dict[str, list[HighScoreEntry]],
+	path: Path | None = None,
+	fsync: bool = True,
+) -> None:
+	"""Atomically replace the highscores file with ``data``.
+
+	The temp file is fsynced before the rename and the directory after it, so
+	a crash leaves either the old or the new file, never a truncated one.
+	Pass ``fsync=False`` to skip both syncs (e.g. in throwaway test dirs).
+	"""
 	p = get_highscores_path(path)
 	serializable = {
 		"modes": {k: [e.to_dict() for e in lst] for k, lst in data.items()}
 	}
 	tmp = p.with_suffix(p.suffix + ".tmp")
-	tmp.write_text(json.dumps(serializable, indent=2), encoding="utf-8")
-	tmp.replace(p)
+	if orjson is not None:
+		payload = orjson.dumps(serializable, option=orjson.OPT_INDENT_2)
+	else:
+		payload = json.dumps(serializable, indent=2).encode("utf-8")
+	with open(tmp, "wb") as f:
+		f.write(payload)
+		if fsync:
+			f.flush()
+			os.fsync(f.fileno())
+	os.replace(tmp, p)
+	if fsync:
+		_fsync_dir(p.parent)
+	_DIRTY.pop(p, None)  # what was just written supersedes any queued state
+	sig = _file_signature(p)
+	if sig is not None:
+		_cache_store(p, sig, _copy_store(data))
+
+
+def _rank_key(e: HighScoreEntry) -> tuple[float, float, str]:
+	return (-e.wpm, -e.accuracy, e.timestamp)
 
 
 def insert_entry(
@@ -150,15 +281,19 @@ def insert_entry(
 
 	Returns True if entry is kept (in top_n) for its mode.
 	Ordering: WPM desc, then accuracy desc, then timestamp asc (older first).
+	Lists are kept in that order, so the entry is placed by binary search
+	(after any exact ties, as a stable sort would) instead of re-sorting.
 	"""
 	lst = store.setdefault(entry.mode_key, [])
-	lst.append(entry)
-	lst.sort(key=lambda e: (-e.wpm, -e.accuracy, e.timestamp))
+	key = _rank_key(entry)
+	pos = bisect_right(lst, key, key=_rank_key)
+	if pos >= top_n:
+		if len(lst) > top_n:
+			del lst[top_n:]
+		return False
+	lst.insert(pos, entry)
 	if len(lst) > top_n:
-		trimmed = lst[:top_n]
-		kept = entry in trimmed
-		store[entry.mode_key] = trimmed
-		return kept
+		del lst[top_n:]
 	return True
 
 
@@ -172,6 +307,8 @@ def record_highscore(
 
 	Returns True if entry ended up stored; False if discarded due to ranking.
 	"""
+	if _ranks_below_cutoff(get_highscores_path(path), entry, top_n):
+		return False  # no load or rewrite for a non-record run
 	store = load_highscores(path)
 	kept = insert_entry(store, entry, top_n=top_n)
 	if kept:
@@ -179,6 +316,44 @@ def record_highscore(
 	return kept
 
 
+def queue_highscore(
+	mode_key: str,
+	entry: HighScoreEntry,
+	path: Path | None = None,
+	top_n: int = 25,
+) -> bool:
+	"""Deferred :func:`record_highscore`.
+
+	The entry is merged into the in-memory store immediately (so loads and
+	get_best_wpm see it) but the file is rewritten at most once every
+	``FLUSH_INTERVAL`` seconds; anything still pending is flushed at exit.
+	Returns True if the entry ranks within top_n.
+	"""
+	p = get_highscores_path(path)
+	if _ranks_below_cutoff(p, entry, top_n):
+		return False
+	store = load_highscores(p)
+	kept = insert_entry(store, entry, top_n=top_n)
+	if not kept:
+		return False
+	_DIRTY[p] = store
+	_BEST_BY_KEY[p] = _best_by_key(store)
+	if time.monotonic() - _last_flush >= FLUSH_INTERVAL:
+		flush_highscores()
+	return True
+
+
+def flush_highscores() -> None:
+	"""Write every store with queued entries to disk."""
+	global _last_flush
+	for p, store in list(_DIRTY.items()):
+		save_highscores(store, p)
+	_last_flush = time.monotonic()
+
+
+atexit.register(flush_highscores)
+
+
 def get_top_highscores(mode_key: str, limit: int = 10, path: Path | None = None) -> list[HighScoreEntry]:
 	"""Return up to `limit` highscores for the given mode key.
 
@@ -188,7 +363,23 @@ def get_top_highscores(mode_key: str, limit: int = 10, path: Path | None = None)
 	if limit <= 0:
 		return []
 	store = load_highscores(path)
-	entries = store.get(mode_key, [])
-	# Ensure ordering (in case file manually edited)
-	ordered = sorted(entries, key=lambda e: (-e.wpm, -e.accuracy, e.timestamp))
-	return ordered[:limit]
+	# Lists are sorted best-first when cached (hand-edited files included)
+	return store.get(mode_key, [])[:limit]
+
+
+def get_best_wpm(mode_key: str, path: Path | None = None) -> float | None:
+	"""Return the best stored net WPM for ``mode_key``, or None if none exist.
+
+	Served from the maxima maintained alongside the store cache, so repeated
+	lookups cost a stat call and a dict lookup instead of a scan.
+	"""
+	p = get_highscores_path(path)
+	if p in _DIRTY:  # maxima already updated by queue_highscore
+		return _BEST_BY_KEY.get(p, {}).get(mode_key)
+	sig = _file_signature(p)
+	if sig is None:
+		return None
+	cached = _STORE_CACHE.get(p)
+	if cached is None or cached[0] != sig:
+		load_highscores(p)  # repopulates both caches (unless the file is corrupt)
+	return _BEST_BY_KEY.get(p, {}).get(mode_key)
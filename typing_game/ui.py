@@ -20,13 +20,27 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import groupby
+from operator import eq
 from types import ModuleType
 from typing import Any, List, Sequence, Tuple, Optional
 
-try:  # runtime optional import
-	import curses  # type: ignore
-except Exception:  # pragma: no cover - fallback path
-	curses = None  # type: ignore[assignment]
+# Imported lazily by _curses() when a session starts, keeping curses out of
+# the startup path; helpers below treat None as "plain mode".
+curses: ModuleType | None = None
+
+
+@lru_cache(maxsize=1)
+def _curses() -> ModuleType | None:
+	"""Import curses on first use and publish it as the module global."""
+	global curses
+	try:
+		import curses as mod  # type: ignore
+	except Exception:  # pragma: no cover - fallback path
+		return None
+	curses = mod
+	return mod
 
 __all__ = [
 	"CursesSession",
@@ -94,6 +108,7 @@ class CursesSession:
 	fallback: bool = False
 
 	def __enter__(self):  # pragma: no cover (curses specific)
+		curses = _curses()
 		if curses is None:
 			self.fallback = True
 			return None
@@ -124,14 +139,20 @@ class CursesSession:
 
 class UIThrottle:
 	def __init__(self, min_interval_sec: float = 0.06):
-		self.min_interval = min_interval_sec
-		self._last = 0.0
-
-	def should_render(self, now: float | None = None) -> bool:
-		if now is None:
-			now = time.monotonic()
-		if now - self._last >= self.min_interval:
-			self._last = now
+		# Integer nanoseconds so the per-frame gate is an int compare
+		self._min_interval_ns = int(min_interval_sec * 1_000_000_000)
+		self._last_ns = 0
+
+	@property
+	def min_interval(self) -> float:
+		return self._min_interval_ns / 1_000_000_000
+
+	def should_render(self, now_ns: int | None = None) -> bool:
+		"""Return True at most once per interval; ``now_ns`` is time.monotonic_ns()."""
+		if now_ns is None:
+			now_ns = time.monotonic_ns()
+		if now_ns - self._last_ns >= self._min_interval_ns:
+			self._last_ns = now_ns
 			return True
 		return False
 
@@ -145,40 +166,51 @@ def wrap_words(words: Sequence[str], width: int) -> List[str]:
 	"""
 	if width <= 0:
 		return [" ".join(words)] if words else []
-	lines: List[str] = []
-	cur: List[str] = []
-	cur_len = 0
-	for w in words:
+	# Scan with running lengths recording break indices; join each line once
+	breaks: List[Tuple[int, int]] = []
+	start = 0
+	cur_len = -1  # no leading separator before the first word of a line
+	for i, w in enumerate(words):
 		wlen = len(w)
-		sep = 1 if cur else 0
-		if cur_len + sep + wlen > width and cur:
-			lines.append(" ".join(cur))
-			cur = [w]
+		if cur_len + 1 + wlen > width and i > start:
+			breaks.append((start, i))
+			start = i
 			cur_len = wlen
 		else:
-			cur.append(w)
-			cur_len += sep + wlen
-	if cur:
-		lines.append(" ".join(cur))
-	return lines
+			cur_len += 1 + wlen
+	if start < len(words):
+		breaks.append((start, len(words)))
+	return [" ".join(words[s:e]) for s, e in breaks]
 
 
-def highlight_word(target: str, typed: str, caret: bool = True) -> List[Tuple[str, str]]:
-	"""Return list of (segment, style) for a single word.
+@lru_cache(maxsize=1024)
+def highlight_word(target: str, typed: str, caret: bool = True) -> Tuple[Tuple[str, str], ...]:
+	"""Return (segment, style) pairs for a single word.
 
 	style values: 'correct', 'wrong', 'caret' (for next char), 'pending'.
 	Caret is placed at next character to type if caret flag True and word not complete.
 	Better error visualization for mismatches and omissions.
+	Consecutive typed characters with the same style are merged into one
+	segment, so the painter issues one draw per run instead of per char.
 	"""
 	out: List[Tuple[str, str]] = []
 	
-	# Compare each position of typed vs target
-	for i, ch in enumerate(typed):
-		if i < len(target) and ch == target[i]:
-			out.append((ch, "correct"))
-		else:
-			# Character is wrong (either mismatch or extra)
-			out.append((ch, "wrong"))
+	# Compare typed vs target as runs of equal style
+	if target.startswith(typed):  # common case: everything so far is right
+		if typed:
+			out.append((typed, "correct"))
+	else:
+		i = 0
+		for ok, run in groupby(map(eq, typed, target)):
+			j = i + sum(1 for _ in run)
+			out.append((typed[i:j], "correct" if ok else "wrong"))
+			i = j
+		if i < len(typed):
+			# Extra characters past the end of target are wrong too
+			if out and out[-1][1] == "wrong":
+				out[-1] = (out[-1][0] + typed[i:], "wrong")
+			else:
+				out.append((typed[i:], "wrong"))
 	
 	# Handle remaining characters in target
 	if len(typed) < len(target):
@@ -191,7 +223,8 @@ def highlight_word(target: str, typed: str, caret: bool = True) -> List[Tuple[st
 		else:
 			out.append((target[len(typed):], "pending"))
 	
-	return out
+	# Immutable, since the cached result is shared between frames
+	return tuple(out)
 
 
 def draw_highlighted_word(screen, row: int, col: int, target: str, typed: str) -> None:  # pragma: no cover - curses
@@ -291,6 +324,13 @@ def render_curses_example(screen, text: str, row: int = 0):  # pragma: no cover
 
 BACKSPACE_CODES = {8, 127}
 
+# Token for every 7-bit code: printable ASCII maps to its (prebuilt) char,
+# backspace codes to 'BACKSPACE', remaining control codes to None
+_KEY_TABLE: Tuple[str | None, ...] = tuple(
+	"BACKSPACE" if i in BACKSPACE_CODES else (chr(i) if 32 <= i < 127 else None)
+	for i in range(128)
+)
+
 
 def normalize_key(key: int) -> str | None:
 	"""Normalize a curses key code / ordinal to semantic token or char.
@@ -301,15 +341,11 @@ def normalize_key(key: int) -> str | None:
 	  - single-character string for printable characters
 	  - None for ignored control keys
 	"""
-	if key in BACKSPACE_CODES:
-		return "BACKSPACE"
+	if 0 <= key < 128:  # every key typed while playing lands here
+		return _KEY_TABLE[key]
 	if curses and key == getattr(curses, "KEY_RESIZE", -9999):
 		return "RESIZE"
 	# Curses may return negative for special keys; ignore others for now
-	if key < 0:
-		return None
-	if 32 <= key < 127:  # printable ASCII
-		return chr(key)
 	return None
 
 
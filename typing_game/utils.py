@@ -3,6 +3,7 @@
 Section 15 additions:
  - Simple debug logger gated by env var TYPING_GAME_DEBUG=1
  - Diff rendering helper (line-based) to minimize output churn
+ - Streaming line counter for word list files
 """
 
 from __future__ import annotations
@@ -10,6 +11,7 @@ from __future__ import annotations
 import os
 import sys
 from dataclasses import dataclass
+from pathlib import Path
 from typing import List
 
 _DEBUG_ENABLED = os.environ.get("TYPING_GAME_DEBUG", "0") in {"1", "true", "True"}
@@ -22,6 +24,23 @@ def debug_log(*parts):  # pragma: no cover - side-effect
 		sys.stderr.flush()
 
 
+def count_lines(path: Path, chunk_size: int = 1 << 16) -> int:
+	"""Count lines in a file without decoding or materializing it.
+
+	Matches ``len(path.read_text().splitlines())`` for newline-terminated
+	files and also counts a final unterminated line.
+	"""
+	count = 0
+	last = b""
+	with path.open("rb") as f:
+		for buf in iter(lambda: f.read(chunk_size), b""):
+			count += buf.count(b"\n")
+			last = buf
+	if last and not last.endswith(b"\n"):
+		count += 1
+	return count
+
+
 @dataclass
 class DiffResult:
 	full: bool
@@ -62,31 +81,37 @@ class LineDiffRenderer:
 
 	def __init__(self, stream=None):
 		self._prev: List[str] | None = None
+		self._prev_text: str | None = None
 		self._stream = stream or sys.stdout
 		# Detect dumb terminal
 		self._ansi = os.environ.get("TERM", "dumb") != "dumb"
 
 	def render(self, text: str):  # pragma: no cover - integration side-effect
+		if self._ansi and text == self._prev_text:
+			return  # identical frame: nothing to move or repaint
 		lines = text.splitlines()
 		diff = compute_line_diff(self._prev, lines)
+		# Build the whole frame first so it reaches the tty in one write
 		if diff.full or not self._ansi:
-			self._stream.write("\x1b[2J\x1b[H") if self._ansi else None
-			self._stream.write("\n".join(lines) + "\n")
+			out = "\n".join(lines) + "\n"
+			if self._ansi:
+				out = "\x1b[2J\x1b[H" + out
 		else:
-			# Move cursor to top
-			self._stream.write("\x1b[H")
+			# Move cursor to top, then position, clear and rewrite each changed line
+			buf = ["\x1b[H"]
 			for idx in diff.changed_indices:
-				# Position and rewrite line
-				self._stream.write(f"\x1b[{idx+1};1H")
-				self._stream.write("\x1b[2K")  # clear line
-				self._stream.write(lines[idx] + "\n")
+				buf.append(f"\x1b[{idx+1};1H\x1b[2K{lines[idx]}\n")
+			out = "".join(buf)
+		self._stream.write(out)
 		self._stream.flush()
 		self._prev = lines
+		self._prev_text = text
 		debug_log("Rendered lines:", len(lines), "changed:", len(diff.changed_indices), "full:", diff.full)
 
 
 __all__ = [
 	"debug_log",
+	"count_lines",
 	"compute_line_diff",
 	"DiffResult",
 	"LineDiffRenderer",